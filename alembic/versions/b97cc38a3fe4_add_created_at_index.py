@@ -0,0 +1,31 @@
+"""Add created_at index
+
+Revision ID: b97cc38a3fe4
+Revises: 27a5bdd5601b
+Create Date: 2026-10-19 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b97cc38a3fe4'
+down_revision: Union[str, Sequence[str], None] = '27a5bdd5601b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # B-tree rather than BRIN so sort_by=created_at can read the index in order.
+    # if_not_exists because init_db() already creates it on fresh databases.
+    op.create_index(op.f('ix_seashell_created_at'), 'seashell', ['created_at'], unique=False, if_not_exists=True)
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_seashell_created_at'), table_name='seashell', if_exists=True)
+    # ### end Alembic commands ###
@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 from sqlmodel import Session
 from typing import List, Optional
+from datetime import datetime
 from app.db.session import get_session
-from app.schemas.seashell import SeashellCreate, SeashellRead, SeashellUpdate
+from app.schemas.seashell import (
+    SeashellBatchRead, SeashellBatchRequest, SeashellCreate, SeashellRead, SeashellUpdate
+)
 from app.services.seashell_service import SeashellService
+from app.services.seashell_loader import SeashellLoader, get_seashell_loader
+from app.services.seashell_cache import seashell_list_cache
 
 router = APIRouter()
 
+_seashell_list_adapter = TypeAdapter(List[SeashellRead])
+
 @router.post("/", response_model=SeashellRead, status_code=201)
 def create_seashell(seashell: SeashellCreate, session: Session = Depends(get_session)):
     """Create a new seashell"""
@@ -15,21 +23,71 @@ def create_seashell(seashell: SeashellCreate, session: Session = Depends(get_ses
 @router.get("/", response_model=List[SeashellRead])
 def list_seashells(
     page: int = Query(default=1, ge=1, description="Page number (starts at 1)"),
-    page_size: int = Query(default=10, ge=1, lte=100, description="Items per page (max 100)"),
-    sort_by: str = Query(default="id", pattern="^(id|name|species|description)$", description="Field to sort by"),
+    page_size: int = Query(default=10, ge=1, le=100, description="Items per page (max 100)"),
+    sort_by: str = Query(default="id", pattern="^(id|name|species|description|created_at)$", description="Field to sort by"),
     order: str = Query(default="asc", pattern="^(asc|desc)$", description="Sort order"),
     search: Optional[str] = Query(default=None, description="Search across name, species, and description (case-insensitive)"),
+    created_after: Optional[datetime] = Query(default=None, description="Only seashells created at or after this time (ISO 8601, UTC if no offset)"),
+    created_before: Optional[datetime] = Query(default=None, description="Only seashells created before this time (ISO 8601, UTC if no offset)"),
     session: Session = Depends(get_session)
 ):
     """
     Get all seashells with advanced pagination, search, and sorting.
+    Pages are served from the in-process cache until the next write.
     """
+    cache_key = (page, page_size, sort_by, order, search, created_after, created_before)
+    body = seashell_list_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+    
+    # Capture the generation before querying so a concurrent write can't
+    # leave a stale page behind
+    generation = seashell_list_cache.generation
     skip = (page - 1) * page_size
-    return SeashellService.get_seashells(
+    seashells = SeashellService.get_seashells(
         skip, page_size, session,
         search=search,
-        sort_by=sort_by, order=order
+        sort_by=sort_by, order=order,
+        created_after=created_after, created_before=created_before
+    )
+    body = _seashell_list_adapter.dump_json(
+        _seashell_list_adapter.validate_python(seashells, from_attributes=True)
     )
+    seashell_list_cache.set(cache_key, generation, body)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+async def _load_batch(seashell_ids: List[int], loader: SeashellLoader) -> dict:
+    """
+    Load seashells in request order and report the IDs that weren't found.
+    Repeated IDs are repeated in the output; the loader fetches each only once.
+    """
+    seashells = await loader.load_many(seashell_ids)
+    return {
+        "items": [seashell for seashell in seashells if seashell is not None],
+        "missing": [
+            seashell_id for seashell_id, seashell in zip(seashell_ids, seashells)
+            if seashell is None
+        ],
+    }
+
+@router.get("/batch", response_model=SeashellBatchRead)
+async def get_seashells_batch(
+    ids: str = Query(pattern=r"^\d+(,\d+){0,99}$", description="Comma-separated seashell IDs (max 100)"),
+    loader: SeashellLoader = Depends(get_seashell_loader)
+):
+    """
+    Get many seashells by ID with a single query.
+    Items keep the requested order; unknown or deleted IDs are listed in `missing`.
+    """
+    return await _load_batch([int(seashell_id) for seashell_id in ids.split(",")], loader)
+
+@router.post("/batch", response_model=SeashellBatchRead)
+async def post_seashells_batch(
+    batch: SeashellBatchRequest,
+    loader: SeashellLoader = Depends(get_seashell_loader)
+):
+    """Same as GET /batch, but takes the IDs in the body for long lists (max 1000)"""
+    return await _load_batch(batch.ids, loader)
 
 @router.get("/{seashell_id}", response_model=SeashellRead)
 def get_seashell(seashell_id: int, session: Session = Depends(get_session)):
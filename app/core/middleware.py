@@ -1,10 +1,11 @@
 """
 Middleware for the Seashell API.
-Handles request/response logging and timing.
+Handles request/response logging, timing, and SQL query tracking.
 """
 import time
 from fastapi import Request
 from app.core.logging_config import get_logger
+from app.core.query_stats import track_queries
 
 logger = get_logger(__name__)
 
@@ -32,3 +33,30 @@ async def log_requests(request: Request, call_next):
     )
     
     return response
+
+
+async def track_request_queries(request: Request, call_next):
+    """
+    Count the SQL statements and database time of each request.
+    Reported to clients in the Server-Timing header, and logged as a
+    warning when the same statement repeats enough to look like N+1.
+    """
+    with track_queries() as stats:
+        response = await call_next(request)
+    
+    response.headers["Server-Timing"] = (
+        f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+    )
+    
+    for statement, count in stats.repeated_statements().items():
+        logger.warning(
+            f"Possible N+1 in {request.method} {request.url.path}: "
+            f"statement ran {count} times: {statement}"
+        )
+    
+    logger.debug(
+        f"Queries for {request.method} {request.url.path}: "
+        f"{stats.count} statements in {stats.duration * 1000:.2f}ms"
+    )
+    
+    return response
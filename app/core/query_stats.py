@@ -0,0 +1,110 @@
+"""
+SQL query tracking for the Seashell API.
+Counts statements and database time per request, warns about slow queries,
+and flags statements that repeat suspiciously often (likely N+1 patterns).
+"""
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Queries slower than this (in milliseconds) are logged as warnings
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+# The same statement running this many times in one request looks like N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+
+class QueryStats:
+    """Statement count and total database time for one unit of work"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated_statements(self, threshold: int = N_PLUS_ONE_THRESHOLD):
+        """Statements that ran at least `threshold` times"""
+        return {statement: count for statement, count in self.statements.items() if count >= threshold}
+
+
+# Stats for the request currently being handled (None outside a request)
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect stats for every query run inside this block, on any engine.
+    Used by the middleware to scope stats to one request.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryStats]:
+    """
+    Collect stats for every query run on one engine inside this block,
+    regardless of which thread or request runs it. Handy in tests.
+    """
+    stats = QueryStats()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context.count_queries_start = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, time.perf_counter() - context.count_queries_start)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+
+# Start times live on the execution context, which is thrown away with the
+# statement, so a statement that raises leaves nothing behind on the
+# pooled connection.
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context.query_start_time
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+    if duration * 1000 > SLOW_QUERY_MS:
+        logger.warning(f"Slow query ({duration * 1000:.1f}ms): {statement}")
+
+
+def setup_query_tracking() -> None:
+    """
+    Hook query timing into every engine the app creates.
+    Safe to call more than once.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,114 @@
+"""
+Optional monthly partitioning of the seashell table (PostgreSQL only).
+
+Converts seashell into a table range-partitioned on created_at with one
+partition per month, so time-range queries only scan the months they ask
+for. Not part of the Alembic chain: run it on purpose with
+utils/partition_seashell.py.
+
+Table and sequence names are unqualified, so both functions act on the
+first schema in the connection's search_path.
+"""
+from datetime import date, datetime
+from typing import Iterator
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# How many months ahead of today get their own partition
+FUTURE_MONTHS = 12
+
+_COLUMNS = "id, name, species, description, deleted, created_at"
+
+
+def _month_starts(first: date, last: date) -> Iterator[date]:
+    """First day of every month from `first` through `last`"""
+    month = first.replace(day=1)
+    while month <= last:
+        yield month
+        month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    return date(day.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def is_partitioned(connection: Connection) -> bool:
+    """Whether seashell is already a partitioned table"""
+    return connection.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('seashell'))"
+    )).scalar()
+
+
+def partition_seashell_by_month(connection: Connection) -> None:
+    """
+    Rebuild seashell as a table partitioned by month on created_at.
+    Creates one partition per month from the oldest row up to FUTURE_MONTHS
+    ahead, plus a default partition for anything outside that range.
+    Run inside a transaction; does nothing if already partitioned.
+    """
+    if is_partitioned(connection):
+        return
+
+    connection.execute(text("ALTER TABLE seashell RENAME TO seashell_unpartitioned"))
+    connection.execute(text("ALTER INDEX ix_seashell_created_at RENAME TO ix_seashell_unpartitioned_created_at"))
+
+    # The partition key must be part of the primary key
+    connection.execute(text("""
+        CREATE TABLE seashell (
+            id INTEGER NOT NULL DEFAULT nextval('seashell_id_seq'),
+            name VARCHAR NOT NULL,
+            species VARCHAR NOT NULL,
+            description VARCHAR,
+            deleted BOOLEAN NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """))
+
+    today = datetime.utcnow().date()
+    oldest = connection.execute(text("SELECT min(created_at) FROM seashell_unpartitioned")).scalar()
+    first_month = oldest.date() if oldest else today
+    for month in _month_starts(first_month, _add_months(today, FUTURE_MONTHS)):
+        connection.execute(text(
+            f"CREATE TABLE seashell_{month:%Y_%m} PARTITION OF seashell "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_add_months(month, 1):%Y-%m-%d}')"
+        ))
+    connection.execute(text("CREATE TABLE seashell_default PARTITION OF seashell DEFAULT"))
+
+    connection.execute(text(
+        f"INSERT INTO seashell ({_COLUMNS}) SELECT {_COLUMNS} FROM seashell_unpartitioned"
+    ))
+    # Move the id sequence over before dropping the table that owns it
+    connection.execute(text("ALTER SEQUENCE seashell_id_seq OWNED BY seashell.id"))
+    connection.execute(text("DROP TABLE seashell_unpartitioned"))
+    connection.execute(text("CREATE INDEX ix_seashell_created_at ON seashell (created_at)"))
+
+
+def unpartition_seashell(connection: Connection) -> None:
+    """
+    Turn a partitioned seashell back into a plain table with the same rows.
+    Run inside a transaction; does nothing if not partitioned.
+    """
+    if not is_partitioned(connection):
+        return
+
+    connection.execute(text("ALTER TABLE seashell RENAME TO seashell_partitioned"))
+    connection.execute(text("ALTER INDEX ix_seashell_created_at RENAME TO ix_seashell_partitioned_created_at"))
+    connection.execute(text("""
+        CREATE TABLE seashell (
+            id INTEGER NOT NULL DEFAULT nextval('seashell_id_seq') PRIMARY KEY,
+            name VARCHAR NOT NULL,
+            species VARCHAR NOT NULL,
+            description VARCHAR,
+            deleted BOOLEAN NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()
+        )
+    """))
+    connection.execute(text(
+        f"INSERT INTO seashell ({_COLUMNS}) SELECT {_COLUMNS} FROM seashell_partitioned"
+    ))
+    connection.execute(text("ALTER SEQUENCE seashell_id_seq OWNED BY seashell.id"))
+    # Dropping the parent drops every monthly partition with it
+    connection.execute(text("DROP TABLE seashell_partitioned"))
+    connection.execute(text("CREATE INDEX ix_seashell_created_at ON seashell (created_at)"))
@@ -1,6 +1,7 @@
 from sqlmodel import Session, SQLModel, create_engine
 import os
 from dotenv import load_dotenv
+from app.db.sqlite import RoutingSession, create_sqlite_engines, is_sqlite_url, setup_search_index
 
 load_dotenv()
 
@@ -13,11 +14,25 @@ if not DATABASE_URL:
         "Please set it in .env file or pass it when running Docker."
     )
 
-engine = create_engine(DATABASE_URL, echo=True)
+if is_sqlite_url(DATABASE_URL):
+    # Embedded mode: one writer connection, a pool of read-only connections
+    engine, read_engine = create_sqlite_engines(DATABASE_URL)
+else:
+    engine = create_engine(DATABASE_URL, echo=True)
+    read_engine = engine
+
+
+def new_session() -> Session:
+    """Open a session, routing reads and writes separately when the backend needs it"""
+    if read_engine is engine:
+        return Session(engine)
+    return RoutingSession(writer=engine, reader=read_engine)
 
 def get_session():
-    with Session(engine) as session:
+    with new_session() as session:
         yield session
 
 def init_db():
     SQLModel.metadata.create_all(engine)
+    if is_sqlite_url(DATABASE_URL):
+        setup_search_index(engine)
@@ -0,0 +1,159 @@
+"""
+Embedded SQLite backend for small single-node deployments.
+
+Selected automatically when DATABASE_URL is a sqlite:// URL. Connections
+are tuned with WAL journaling and cache pragmas, writes go through a
+single writer connection, reads use a small pool of read-only connections,
+and search is served by an FTS5 trigram index.
+"""
+import os
+from typing import Tuple
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session, create_engine
+
+# Execution option marking engines whose database has the seashell_fts index
+FTS_OPTION = "seashell_fts"
+
+# Applied to every new connection
+SQLITE_PRAGMAS = {
+    "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT", "5000"),    # ms to wait for a lock
+    "journal_mode": "WAL",                                       # readers never block the writer
+    "synchronous": "NORMAL",                                     # safe with WAL, far fewer fsyncs
+    "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-65536"),      # negative means KiB (64 MiB)
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", "268435456"),     # 256 MiB
+    "temp_store": "MEMORY",
+}
+
+# Number of read-only connections kept open
+SQLITE_READER_POOL_SIZE = int(os.getenv("SQLITE_READER_POOL_SIZE", "4"))
+# Most read-only connections open at once. Sync endpoints run on FastAPI's
+# threadpool (40 threads), so the default lets every thread read in parallel
+# instead of waiting on the pool; connections above the pool size are closed
+# when returned.
+SQLITE_READER_MAX_CONNECTIONS = max(
+    int(os.getenv("SQLITE_READER_MAX_CONNECTIONS", "40")), SQLITE_READER_POOL_SIZE
+)
+
+
+def is_sqlite_url(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def _is_memory_url(database_url: str) -> bool:
+    return make_url(database_url).database in (None, "", ":memory:")
+
+
+def _apply_pragmas(engine: Engine, read_only: bool) -> None:
+    """Run the tuning pragmas on every connection the engine opens"""
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+def create_sqlite_engines(database_url: str) -> Tuple[Engine, Engine]:
+    """
+    Create the (writer, reader) engines for a SQLite database.
+
+    The writer pool holds exactly one connection, so writes are serialized
+    in-process instead of fighting over SQLite's file lock. Readers keep
+    SQLITE_READER_POOL_SIZE connections open and can grow to
+    SQLITE_READER_MAX_CONNECTIONS under load. An in-memory
+    database can't be shared between connections, so it gets one engine
+    for both roles.
+    """
+    if _is_memory_url(database_url):
+        engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        ).execution_options(**{FTS_OPTION: True})
+        return engine, engine
+
+    writer = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        pool_size=1,
+        max_overflow=0,
+    )
+    _apply_pragmas(writer, read_only=False)
+
+    reader = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        pool_size=SQLITE_READER_POOL_SIZE,
+        max_overflow=SQLITE_READER_MAX_CONNECTIONS - SQLITE_READER_POOL_SIZE,
+    )
+    _apply_pragmas(reader, read_only=True)
+
+    return writer.execution_options(**{FTS_OPTION: True}), reader.execution_options(**{FTS_OPTION: True})
+
+
+class RoutingSession(Session):
+    """Session that sends writes to the writer engine and everything else to the readers"""
+
+    def __init__(self, writer: Engine, reader: Engine, **kwargs):
+        super().__init__(**kwargs)
+        self.writer = writer
+        self.reader = reader
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            return self.writer
+        return self.reader
+
+
+def setup_search_index(engine: Engine) -> None:
+    """
+    Create the FTS5 index over name, species and description, and the
+    triggers that keep it in sync. The trigram tokenizer matches any
+    substring case-insensitively, like the escaped ILIKE search it replaces
+    (which, unlike FTS, folds case for ASCII letters only).
+    """
+    with engine.begin() as connection:
+        exists = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'seashell_fts'"
+        )).first()
+        if exists:
+            return
+
+        connection.execute(text("""
+            CREATE VIRTUAL TABLE seashell_fts USING fts5(
+                name, species, description,
+                content='seashell', content_rowid='id', tokenize='trigram'
+            )
+        """))
+        connection.execute(text("""
+            CREATE TRIGGER seashell_fts_insert AFTER INSERT ON seashell BEGIN
+                INSERT INTO seashell_fts (rowid, name, species, description)
+                VALUES (new.id, new.name, new.species, new.description);
+            END
+        """))
+        connection.execute(text("""
+            CREATE TRIGGER seashell_fts_delete AFTER DELETE ON seashell BEGIN
+                INSERT INTO seashell_fts (seashell_fts, rowid, name, species, description)
+                VALUES ('delete', old.id, old.name, old.species, old.description);
+            END
+        """))
+        connection.execute(text("""
+            CREATE TRIGGER seashell_fts_update AFTER UPDATE OF name, species, description ON seashell BEGIN
+                INSERT INTO seashell_fts (seashell_fts, rowid, name, species, description)
+                VALUES ('delete', old.id, old.name, old.species, old.description);
+                INSERT INTO seashell_fts (rowid, name, species, description)
+                VALUES (new.id, new.name, new.species, new.description);
+            END
+        """))
+        # Index the rows that existed before the index did
+        connection.execute(text("INSERT INTO seashell_fts (seashell_fts) VALUES ('rebuild')"))
+
+
+def uses_search_index(session: Session) -> bool:
+    """Whether this session's database has the FTS5 search index"""
+    return bool(session.get_bind().get_execution_options().get(FTS_OPTION))
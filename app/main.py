@@ -5,13 +5,18 @@ import os
 from app.api import seashells
 from app.db.session import init_db
 from app.core.logging_config import setup_logging, get_logger
-from app.core.middleware import log_requests
+from app.core.middleware import log_requests, track_request_queries
+from app.core.query_stats import setup_query_tracking
+from app.services.seashell_cache import seashell_list_cache
 
 # Setup logging
 log_level = os.getenv("LOG_LEVEL", "INFO")
 setup_logging(log_level=log_level)
 logger = get_logger(__name__)
 
+# Time every SQL statement so requests can report their database cost
+setup_query_tracking()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,6 +35,7 @@ app = FastAPI(title="Seashell Collection API", lifespan=lifespan)
 
 # Add middleware
 app.middleware("http")(log_requests)
+app.middleware("http")(track_request_queries)
 
 # Include routes
 app.include_router(seashells.router, prefix="/seashells", tags=["Seashells"])
@@ -41,6 +47,12 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    """List cache size and hit ratio for monitoring"""
+    return seashell_list_cache.stats()
+
+
 @app.get("/")
 def root():
     return {"message": "Seashell API is running"}
\ No newline at end of file
@@ -8,4 +8,4 @@ class Seashell(SQLModel, table=True):
     species: str
     description: Optional[str] = None
     deleted: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
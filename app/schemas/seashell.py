@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
 
 class SeashellCreate(BaseModel):
     name: str
@@ -8,8 +9,16 @@ class SeashellCreate(BaseModel):
 
 class SeashellRead(SeashellCreate):
     id: int
+    created_at: datetime
 
 class SeashellUpdate(BaseModel):
     name: Optional[str] = None
     species: Optional[str] = None
     description: Optional[str] = None
+
+class SeashellBatchRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=1000)
+
+class SeashellBatchRead(BaseModel):
+    items: List[SeashellRead]
+    missing: List[int]
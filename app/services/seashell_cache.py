@@ -0,0 +1,107 @@
+"""
+In-process cache for seashell list pages.
+Stores ready-to-send JSON keyed by the query parameters and the write
+generation, so repeated reads skip both the database and serialization.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Maximum number of cached pages (0 turns the cache off)
+LIST_CACHE_SIZE = int(os.getenv("LIST_CACHE_SIZE", "256"))
+# Maximum total size of the cached bodies. Descriptions have no length limit,
+# so the page count alone doesn't bound memory.
+LIST_CACHE_MAX_BYTES = int(os.getenv("LIST_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+
+class SeashellListCache:
+    """
+    Bounded LRU cache of serialized list responses.
+
+    Holds at most `max_entries` pages and `max_bytes` of body in total,
+    evicting the least recently used pages to stay under both. A page
+    larger than `max_bytes` on its own is never cached.
+
+    Every write bumps the generation, which makes all earlier entries
+    unreachable. Readers capture the generation before querying, so a
+    result computed while a write was in flight is stored under the old
+    generation and never served.
+
+    The generation lives in this process only. Run a single worker per
+    database, or set LIST_CACHE_SIZE=0, when several processes write.
+    """
+
+    def __init__(self, max_entries: int = LIST_CACHE_SIZE, max_bytes: int = LIST_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, params: Hashable) -> Optional[bytes]:
+        """Get the cached body for these query parameters at the current generation"""
+        with self._lock:
+            body = self._entries.get((params, self.generation))
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((params, self.generation))
+            self.hits += 1
+            return body
+
+    def set(self, params: Hashable, generation: int, body: bytes) -> None:
+        """Store a body computed at `generation`, evicting the oldest pages if full"""
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            previous = self._entries.pop((params, generation), None)
+            if previous is not None:
+                self.size_bytes -= len(previous)
+            self._entries[(params, generation)] = body
+            self.size_bytes += len(body)
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+
+    def bump_generation(self) -> None:
+        """Invalidate every cached page; call after each committed write"""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Current size and hit ratio, for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "generation": self.generation,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Shared by every request in this process
+seashell_list_cache = SeashellListCache()
@@ -0,0 +1,86 @@
+"""
+Request-scoped batching loader for seashells.
+Merges single-ID lookups made in the same event-loop tick into one query.
+"""
+import asyncio
+from typing import Dict, List, Optional
+from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+from app.db.session import get_session
+from app.models.seashell import Seashell
+from app.services.seashell_service import SeashellService
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SeashellLoader:
+    """
+    Collects seashell IDs requested concurrently and fetches them together.
+
+    Every load() call made before the event loop gets back to the loader
+    is answered by a single WHERE id IN (...) query. Only one query runs
+    at a time, because the request's Session is not thread-safe; IDs
+    requested while a query is running go out together in the next one.
+    Results are remembered for the lifetime of the loader, so create one
+    per request.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        # One future per ID ever requested; a finished future is the cache
+        self._futures: Dict[int, asyncio.Future] = {}
+        self._pending: List[int] = []
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._query_lock = asyncio.Lock()
+
+    async def load(self, seashell_id: int) -> Optional[Seashell]:
+        """Get one seashell by ID, or None if it doesn't exist or is deleted"""
+        future = self._futures.get(seashell_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[seashell_id] = future
+            self._pending.append(seashell_id)
+            # The dispatch task runs after every coroutine that is already
+            # scheduled, so all of their IDs end up in the same batch
+            if self._dispatch_task is None:
+                self._dispatch_task = loop.create_task(self._dispatch())
+        return await future
+
+    async def load_many(self, seashell_ids: List[int]) -> List[Optional[Seashell]]:
+        """Get seashells for many IDs, in the same order as requested"""
+        return await asyncio.gather(*(self.load(seashell_id) for seashell_id in seashell_ids))
+
+    async def _dispatch(self) -> None:
+        """Fetch every pending ID with one query and resolve the waiting futures"""
+        async with self._query_lock:
+            # Take the batch only once the previous query is done, so IDs
+            # that piled up while it ran are fetched together
+            pending = self._pending
+            self._pending = []
+            self._dispatch_task = None
+            logger.debug(f"Dispatching batched lookup for {len(pending)} seashells")
+
+            try:
+                found = await run_in_threadpool(
+                    SeashellService.get_seashells_by_ids, pending, self.session
+                )
+            except Exception as e:
+                for seashell_id in pending:
+                    # Forget failed lookups so a later load() can retry them
+                    future = self._futures.pop(seashell_id)
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for seashell_id in pending:
+                future = self._futures[seashell_id]
+                if not future.done():
+                    future.set_result(found.get(seashell_id))
+
+
+def get_seashell_loader(session: Session = Depends(get_session)) -> SeashellLoader:
+    """Create a fresh loader for each request"""
+    return SeashellLoader(session)
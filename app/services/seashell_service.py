@@ -1,13 +1,104 @@
 from sqlmodel import Session, select
-from typing import List, Optional
+from sqlalchemy import bindparam, insert, literal_column, table, text, update
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
 from fastapi import HTTPException
 from app.models.seashell import Seashell
+from app.db.sqlite import uses_search_index
 from app.schemas.seashell import SeashellCreate, SeashellUpdate
+from app.services.seashell_cache import seashell_list_cache
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+# Query shapes used by the service, each built only once.
+# Every call reuses the same statement object and only swaps the bound
+# parameter values, which skips building the select() and generating its
+# cache key on each request. SQLAlchemy already cached the compiled SQL for
+# freshly built statements, so the saving is Python-side only.
+SORTABLE_FIELDS = ("id", "name", "species", "description", "created_at")
+
+_not_deleted = Seashell.deleted.is_(False)
+_search_param = bindparam("search")
+
+_get_by_id_statement = select(Seashell).where(
+    Seashell.id == bindparam("seashell_id"),
+    _not_deleted,
+)
+
+_get_by_ids_statement = select(Seashell).where(
+    Seashell.id.in_(bindparam("seashell_ids", expanding=True)),
+    _not_deleted,
+)
+
+# Writes hand back the stored row with RETURNING, so none of them
+# needs a follow-up SELECT
+_returning_columns = tuple(Seashell.__table__.columns)
+
+# UPDATE of one non-deleted seashell; matches no row if it's missing or deleted
+_active_update_statement = (
+    update(Seashell)
+    .where(Seashell.id == bindparam("seashell_id"), _not_deleted)
+    .execution_options(synchronize_session=False)
+)
+
+_delete_statement = _active_update_statement.values(deleted=True).returning(Seashell.id)
+
+# The search term is escaped, so % and _ match themselves like they do in FTS
+_search_filter = (
+    Seashell.name.ilike(_search_param, escape="\\") |
+    Seashell.species.ilike(_search_param, escape="\\") |
+    Seashell.description.ilike(_search_param, escape="\\")
+)
+
+# Same search served by the SQLite FTS5 trigram index (see app.db.sqlite)
+_fts_search_filter = Seashell.id.in_(
+    select(literal_column("rowid"))
+    .select_from(table("seashell_fts"))
+    .where(text("seashell_fts MATCH :search_fts"))
+)
+
+# Trigrams can't match anything shorter than three characters
+FTS_MIN_SEARCH_LENGTH = 3
+
+
+@lru_cache(maxsize=None)
+def _list_statement(
+    sort_by: str,
+    order: str,
+    search_mode: Optional[str],
+    with_created_after: bool,
+    with_created_before: bool,
+):
+    """Build one list query shape with filters and offset/limit as bound parameters"""
+    statement = select(Seashell).where(_not_deleted)
+    if search_mode == "fts":
+        statement = statement.where(_fts_search_filter)
+    elif search_mode == "ilike":
+        statement = statement.where(_search_filter)
+    if with_created_after:
+        statement = statement.where(Seashell.created_at >= bindparam("created_after"))
+    if with_created_before:
+        statement = statement.where(Seashell.created_at < bindparam("created_before"))
+    sort_column = getattr(Seashell, sort_by)
+    statement = statement.order_by(sort_column.desc() if order == "desc" else sort_column.asc())
+    return statement.offset(bindparam("skip")).limit(bindparam("limit"))
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so the value is matched as a literal substring"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """created_at is stored as naive UTC, so compare against naive UTC too"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 class SeashellService:
     """Service layer for seashell business logic"""
     
@@ -16,10 +107,13 @@ class SeashellService:
         """Create a new seashell"""
         logger.info(f"Creating new seashell: {seashell_data.name}")
         try:
-            db_seashell = Seashell.model_validate(seashell_data)
-            session.add(db_seashell)
+            values = Seashell.model_validate(seashell_data).model_dump(exclude={"id"})
+            row = session.exec(
+                insert(Seashell).values(**values).returning(*_returning_columns)
+            ).one()
             session.commit()
-            session.refresh(db_seashell)
+            seashell_list_cache.bump_generation()
+            db_seashell = Seashell.model_validate(row._mapping)
             logger.info(f"Successfully created seashell with ID: {db_seashell.id}")
             return db_seashell
         except Exception as e:
@@ -34,32 +128,38 @@ class SeashellService:
         session: Session,
         search: Optional[str] = None,
         sort_by: str = "id",
-        order: str = "asc"
+        order: str = "asc",
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
     ) -> List[Seashell]:
-        """Get all non-deleted seashells with pagination, search, and sorting"""
-        # Base query - only non-deleted items
-        statement = select(Seashell).where(Seashell.deleted.is_(False))
-        
-        # Apply global search across name, species, and description
+        """
+        Get all non-deleted seashells with pagination, search, sorting,
+        and an optional created_at range (after is inclusive, before is exclusive)
+        """
+        if sort_by not in SORTABLE_FIELDS:
+            sort_by = "id"
+        if order != "desc":
+            order = "asc"
+        search_mode = None
         if search:
-            search_filter = f"%{search}%"
-            statement = statement.where(
-                (Seashell.name.ilike(search_filter)) |
-                (Seashell.species.ilike(search_filter)) |
-                (Seashell.description.ilike(search_filter))
-            )
-        
-        # Apply sorting
-        sort_column = getattr(Seashell, sort_by, Seashell.id)
-        if order == "desc":
-            statement = statement.order_by(sort_column.desc())
-        else:
-            statement = statement.order_by(sort_column.asc())
+            use_fts = len(search) >= FTS_MIN_SEARCH_LENGTH and uses_search_index(session)
+            search_mode = "fts" if use_fts else "ilike"
+        statement = _list_statement(
+            sort_by, order, search_mode, created_after is not None, created_before is not None
+        )
         
-        # Apply pagination
-        statement = statement.offset(skip).limit(limit)
+        params = {"skip": skip, "limit": limit}
+        if search_mode == "fts":
+            # Quoted as one phrase so FTS5 operators in the input are matched literally
+            params["search_fts"] = '"' + search.replace('"', '""') + '"'
+        elif search_mode == "ilike":
+            params["search"] = f"%{_escape_like(search)}%"
+        if created_after is not None:
+            params["created_after"] = _to_naive_utc(created_after)
+        if created_before is not None:
+            params["created_before"] = _to_naive_utc(created_before)
         
-        results = session.exec(statement).all()
+        results = session.exec(statement, params=params).all()
         logger.debug(f"Retrieved {len(results)} seashells (page {skip // limit + 1})")
         return results
     
@@ -67,35 +167,68 @@ class SeashellService:
     def get_seashell_by_id(seashell_id: int, session: Session) -> Seashell:
         """Get a single seashell by ID"""
         logger.debug(f"Fetching seashell with ID: {seashell_id}")
-        seashell = session.get(Seashell, seashell_id)
-        if not seashell or seashell.deleted:
+        seashell = session.exec(
+            _get_by_id_statement, params={"seashell_id": seashell_id}
+        ).first()
+        if not seashell:
             logger.warning(f"Seashell not found: ID {seashell_id}")
             raise HTTPException(status_code=404, detail="Seashell not found")
         return seashell
     
+    @staticmethod
+    def get_seashells_by_ids(seashell_ids: List[int], session: Session) -> Dict[int, Seashell]:
+        """Get non-deleted seashells for many IDs in one query, keyed by ID"""
+        unique_ids = list(dict.fromkeys(seashell_ids))
+        logger.debug(f"Fetching {len(unique_ids)} seashells by ID")
+        results = session.exec(
+            _get_by_ids_statement, params={"seashell_ids": unique_ids}
+        ).all()
+        return {seashell.id: seashell for seashell in results}
+    
     @staticmethod
     def update_seashell(seashell_id: int, seashell_update: SeashellUpdate, session: Session) -> Seashell:
         """Update a seashell by ID"""
         logger.info(f"Updating seashell ID: {seashell_id}")
-        seashell = SeashellService.get_seashell_by_id(seashell_id, session)
         
         # Update only fields that were provided
         update_data = seashell_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(seashell, key, value)
+        if not update_data:
+            return SeashellService.get_seashell_by_id(seashell_id, session)
+        
+        # One round trip: the WHERE clause doubles as the existence check
+        try:
+            row = session.exec(
+                _active_update_statement.values(**update_data).returning(*_returning_columns),
+                params={"seashell_id": seashell_id},
+            ).first()
+            session.commit()
+        except Exception as e:
+            logger.error(f"Failed to update seashell ID {seashell_id}: {str(e)}", exc_info=True)
+            session.rollback()
+            raise
+        if row is None:
+            logger.warning(f"Seashell not found: ID {seashell_id}")
+            raise HTTPException(status_code=404, detail="Seashell not found")
+        seashell_list_cache.bump_generation()
         
-        session.add(seashell)
-        session.commit()
-        session.refresh(seashell)
         logger.info(f"Successfully updated seashell ID: {seashell_id}")
-        return seashell
+        return Seashell.model_validate(row._mapping)
     
     @staticmethod
     def delete_seashell(seashell_id: int, session: Session) -> None:
         """Soft delete a seashell by ID"""
         logger.info(f"Deleting seashell ID: {seashell_id}")
-        seashell = SeashellService.get_seashell_by_id(seashell_id, session)
-        seashell.deleted = True
-        session.add(seashell)
-        session.commit()
+        try:
+            row = session.exec(
+                _delete_statement, params={"seashell_id": seashell_id}
+            ).first()
+            session.commit()
+        except Exception as e:
+            logger.error(f"Failed to delete seashell ID {seashell_id}: {str(e)}", exc_info=True)
+            session.rollback()
+            raise
+        if row is None:
+            logger.warning(f"Seashell not found: ID {seashell_id}")
+            raise HTTPException(status_code=404, detail="Seashell not found")
+        seashell_list_cache.bump_generation()
         logger.info(f"Successfully deleted seashell ID: {seashell_id}")
@@ -1,9 +1,12 @@
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlmodel import SQLModel, Session, create_engine
 from sqlmodel.pool import StaticPool
 from app.main import app
 from app.db.session import get_session
+from app.core.query_stats import count_queries
+from app.services.seashell_cache import seashell_list_cache
 
 
 @pytest.fixture(name="session")
@@ -31,6 +34,29 @@ def client_fixture(session: Session):
         return session
 
     app.dependency_overrides[get_session] = get_session_override
+    # Each test gets its own database, so it must not see another test's pages
+    seashell_list_cache.clear()
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(name="assert_max_queries")
+def assert_max_queries_fixture(session: Session):
+    """
+    Fails the test if the wrapped block runs more SQL statements than allowed.
+    
+    Usage:
+        with assert_max_queries(2):
+            client.get("/seashells/1")
+    """
+    @contextmanager
+    def _assert_max_queries(max_queries: int):
+        with count_queries(session.get_bind()) as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"Expected at most {max_queries} queries, ran {stats.count}:\n"
+            + "\n".join(stats.statements.elements())
+        )
+    
+    return _assert_max_queries
@@ -0,0 +1,101 @@
+"""
+Checks for the optional monthly partitioning in app/db/partitioning.py.
+Runs against the PostgreSQL DATABASE_URL (the CI service) inside a scratch
+schema and a rolled-back transaction, so the real tables are never touched.
+"""
+import os
+import re
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlmodel import SQLModel
+
+from app.db.partitioning import is_partitioned, partition_seashell_by_month, unpartition_seashell
+
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+
+
+@pytest.fixture(name="pg_connection")
+def pg_connection_fixture():
+    """Connects to PostgreSQL with a fresh seashell table in a scratch schema"""
+    if not DATABASE_URL.startswith("postgresql"):
+        pytest.skip("Partitioning needs a PostgreSQL DATABASE_URL")
+    engine = create_engine(DATABASE_URL)
+    schema = f"partition_test_{uuid.uuid4().hex[:8]}"
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+        connection.execute(text(f"SET LOCAL search_path TO {schema}"))
+        SQLModel.metadata.create_all(connection)
+        try:
+            yield connection
+        finally:
+            transaction.rollback()
+    engine.dispose()
+
+
+def _add_seashells(connection, created_ats):
+    for created_at in created_ats:
+        connection.execute(
+            text(
+                "INSERT INTO seashell (name, species, deleted, created_at) "
+                "VALUES ('Shell', 'Species', false, :created_at)"
+            ),
+            {"created_at": created_at},
+        )
+
+
+def test_time_range_query_prunes_partitions(pg_connection):
+    """
+    Partitions a table holding shells from several months, then runs EXPLAIN
+    on a query for one month. Only that month's partition should be scanned.
+    """
+    this_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    _add_seashells(pg_connection, [datetime(2026, 1, 15), datetime(2026, 2, 15), this_month])
+
+    partition_seashell_by_month(pg_connection)
+
+    assert is_partitioned(pg_connection)
+    assert pg_connection.execute(text("SELECT count(*) FROM seashell")).scalar() == 3
+
+    plan = "\n".join(pg_connection.execute(
+        text(
+            "EXPLAIN SELECT * FROM seashell "
+            "WHERE deleted IS false AND created_at >= :created_after AND created_at < :created_before"
+        ),
+        {"created_after": date(2026, 2, 1), "created_before": date(2026, 3, 1)},
+    ).scalars())
+
+    scanned = set(re.findall(r"seashell_(?:\d{4}_\d{2}|default)\b", plan))
+    assert scanned == {"seashell_2026_02"}
+
+
+def test_new_rows_land_in_partitions(pg_connection):
+    """
+    Inserts a shell after partitioning.
+    Should get the next id from the original sequence and go to its month's partition.
+    """
+    _add_seashells(pg_connection, [datetime(2026, 1, 15)])
+    partition_seashell_by_month(pg_connection)
+
+    _add_seashells(pg_connection, [datetime.utcnow()])
+
+    rows = pg_connection.execute(text("SELECT id, tableoid::regclass::text FROM seashell ORDER BY id")).all()
+    assert [row[0] for row in rows] == [1, 2]
+    assert rows[1][1] == f"seashell_{datetime.utcnow():%Y_%m}"
+
+
+def test_unpartition_restores_plain_table(pg_connection):
+    """
+    Partitions and then undoes it.
+    Should end up with a plain table holding the same rows.
+    """
+    _add_seashells(pg_connection, [datetime(2026, 1, 15), datetime(2026, 2, 15)])
+    partition_seashell_by_month(pg_connection)
+
+    unpartition_seashell(pg_connection)
+
+    assert not is_partitioned(pg_connection)
+    assert pg_connection.execute(text("SELECT count(*) FROM seashell")).scalar() == 2
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+
+from app.core.middleware import track_request_queries
+from app.core.query_stats import N_PLUS_ONE_THRESHOLD, count_queries, track_queries
+
+
+def test_failed_query_does_not_skew_next_query(session: Session):
+    """
+    Runs a statement the database rejects, waits, then runs a good one.
+    Only the good statement should be counted, its time should not include
+    the wait after the failure, and nothing should pile up on the pooled
+    connection.
+    """
+    pause = 0.05
+    connection_info = dict(session.connection().info)
+
+    with count_queries(session.get_bind()) as engine_stats, track_queries() as request_stats:
+        with pytest.raises(OperationalError):
+            session.exec(text("SELECT * FROM no_such_table"))
+        session.rollback()
+        time.sleep(pause)
+        session.exec(text("SELECT 1"))
+
+    for stats in (engine_stats, request_stats):
+        assert stats.count == 1
+        assert list(stats.statements) == ["SELECT 1"]
+        assert stats.duration < pause
+    assert session.connection().info == connection_info
+
+
+def test_slow_query_is_logged(session: Session, monkeypatch, caplog):
+    """
+    Runs a query with the slow-query threshold turned all the way down.
+    Should log a warning naming the statement.
+    """
+    monkeypatch.setattr("app.core.query_stats.SLOW_QUERY_MS", -1)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        session.exec(text("SELECT 1"))
+
+    assert any(
+        "Slow query" in record.message and "SELECT 1" in record.message
+        for record in caplog.records
+    )
+
+
+def test_repeated_statement_is_logged_as_n_plus_one(session: Session, caplog):
+    """
+    Runs the same statement enough times in one request to look like N+1.
+    The middleware should warn about it; a statement run once should not be flagged.
+    """
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/seashells/",
+        "headers": [],
+        "query_string": b"",
+    })
+
+    async def call_next(request):
+        for _ in range(N_PLUS_ONE_THRESHOLD):
+            session.exec(text("SELECT 1"))
+        session.exec(text("SELECT 2"))
+        return Response()
+
+    with caplog.at_level(logging.WARNING, logger="app.core.middleware"):
+        response = asyncio.run(track_request_queries(request, call_next))
+
+    warnings = [record.message for record in caplog.records if "Possible N+1" in record.message]
+    assert len(warnings) == 1
+    assert "GET /seashells/" in warnings[0]
+    assert f"statement ran {N_PLUS_ONE_THRESHOLD} times: SELECT 1" in warnings[0]
+    assert f'desc="{N_PLUS_ONE_THRESHOLD + 1} queries"' in response.headers["Server-Timing"]
@@ -0,0 +1,66 @@
+from app.services.seashell_cache import SeashellListCache
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    Fills the cache past its limit.
+    The page that was used least recently should be dropped first.
+    """
+    cache = SeashellListCache(max_entries=2)
+    cache.set("a", 0, b"A")
+    cache.set("b", 0, b"B")
+    cache.get("a")
+    cache.set("c", 0, b"C")
+    
+    assert cache.get("a") == b"A"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"C"
+    assert cache.stats()["entries"] == 2
+
+
+def test_cache_evicts_to_stay_under_byte_budget():
+    """
+    Stores pages whose total size goes past the byte budget.
+    The oldest pages should be dropped until the rest fit, and a page
+    bigger than the whole budget should not be stored at all.
+    """
+    cache = SeashellListCache(max_entries=10, max_bytes=10)
+    cache.set("a", 0, b"AAAA")
+    cache.set("b", 0, b"BBBB")
+    cache.set("c", 0, b"CCCC")
+    
+    assert cache.get("a") is None
+    assert cache.get("b") == b"BBBB"
+    assert cache.get("c") == b"CCCC"
+    assert cache.stats()["bytes"] == 8
+    
+    cache.set("huge", 0, b"X" * 11)
+    
+    assert cache.get("huge") is None
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 8
+
+
+def test_cache_ignores_pages_from_old_generation():
+    """
+    Stores a page that was computed before a write finished.
+    It should never be served.
+    """
+    cache = SeashellListCache(max_entries=10)
+    generation = cache.generation
+    cache.bump_generation()
+    cache.set("a", generation, b"stale")
+    
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_disabled_with_zero_size():
+    """
+    A cache with no room should never store anything.
+    """
+    cache = SeashellListCache(max_entries=0)
+    cache.set("a", 0, b"A")
+    
+    assert cache.get("a") is None
+    assert cache.stats()["hit_ratio"] == 0.0
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+from sqlmodel import Session
+
+from app.models.seashell import Seashell
+from app.services.seashell_loader import SeashellLoader
+from app.services.seashell_service import SeashellService
+
+# How long each batched query takes, so later lookups can arrive while it runs
+QUERY_DELAY = 0.05
+
+
+@pytest.fixture(name="lookup_calls")
+def lookup_calls_fixture(monkeypatch):
+    """
+    Records the IDs of every batched query the loader runs.
+    Each query is slowed down by QUERY_DELAY and fails if another one is
+    still running on the Session.
+    """
+    calls = []
+    running = []
+    original = SeashellService.get_seashells_by_ids
+    
+    def recording_get_seashells_by_ids(seashell_ids, session):
+        assert not running, "batched queries overlapped on one Session"
+        running.append(True)
+        try:
+            calls.append(list(seashell_ids))
+            time.sleep(QUERY_DELAY)
+            return original(seashell_ids, session)
+        finally:
+            running.pop()
+    
+    monkeypatch.setattr(SeashellService, "get_seashells_by_ids", recording_get_seashells_by_ids)
+    return calls
+
+
+def test_loader_merges_concurrent_lookups(session: Session, lookup_calls):
+    """
+    Starts several single-ID lookups at the same time.
+    They should all be answered by one batched query.
+    """
+    shells = [Seashell(name=f"Shell {i}", species=f"Species {i}") for i in range(3)]
+    session.add_all(shells)
+    session.commit()
+    ids = [shell.id for shell in shells]
+    
+    async def load_all():
+        loader = SeashellLoader(session)
+        return await asyncio.gather(
+            loader.load(ids[1]), loader.load(ids[0]), loader.load(99999), loader.load(ids[1])
+        )
+    
+    results = asyncio.run(load_all())
+    
+    assert len(lookup_calls) == 1
+    assert sorted(lookup_calls[0]) == sorted([ids[0], ids[1], 99999])
+    assert [shell.id if shell else None for shell in results] == [ids[1], ids[0], None, ids[1]]
+
+
+def test_loader_remembers_results(session: Session, lookup_calls):
+    """
+    Loads the same ID twice, one after the other.
+    The second lookup should be served from the loader without another query.
+    """
+    shell = Seashell(name="Cached", species="Cached")
+    session.add(shell)
+    session.commit()
+    
+    async def load_twice():
+        loader = SeashellLoader(session)
+        first = await loader.load(shell.id)
+        second = await loader.load(shell.id)
+        return first, second
+    
+    first, second = asyncio.run(load_twice())
+    
+    assert len(lookup_calls) == 1
+    assert first is second
+
+
+def test_loader_runs_one_query_at_a_time(session: Session, lookup_calls):
+    """
+    Starts a lookup, then asks for more IDs while the first query is still running.
+    The queries should never overlap on the shared Session, and the late IDs
+    should go out together in one follow-up batch.
+    """
+    shells = [Seashell(name=f"Shell {i}", species=f"Species {i}") for i in range(3)]
+    session.add_all(shells)
+    session.commit()
+    ids = [shell.id for shell in shells]
+    
+    async def load_staggered():
+        loader = SeashellLoader(session)
+        first = asyncio.create_task(loader.load(ids[0]))
+        await asyncio.sleep(QUERY_DELAY / 2)
+        late = [asyncio.create_task(loader.load(ids[1])), asyncio.create_task(loader.load(ids[2]))]
+        return await asyncio.gather(first, *late)
+    
+    results = asyncio.run(load_staggered())
+    
+    assert lookup_calls == [[ids[0]], [ids[1], ids[2]]]
+    assert [shell.id for shell in results] == ids
@@ -1,4 +1,9 @@
+from datetime import datetime
+
 from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.seashell import Seashell
 
 
 def test_health_check(client: TestClient):
@@ -122,6 +127,20 @@ def test_list_seashells_search(client: TestClient):
     assert data[0]["name"] == "Conch Shell"
 
 
+def test_list_seashells_search_is_literal(client: TestClient):
+    """
+    Searches for terms containing % and _.
+    They should match only themselves, not act as wildcards.
+    """
+    client.post("/seashells/", json={"name": "50% Shell", "species": "Cypraea"})
+    client.post("/seashells/", json={"name": "5000 Shell", "species": "Cypraea"})
+    client.post("/seashells/", json={"name": "Sea_Snail", "species": "Strombus"})
+    client.post("/seashells/", json={"name": "SeaXSnail", "species": "Strombus"})
+    
+    assert [s["name"] for s in client.get("/seashells/?search=50%25").json()] == ["50% Shell"]
+    assert [s["name"] for s in client.get("/seashells/?search=a_S").json()] == ["Sea_Snail"]
+
+
 def test_get_seashell_by_id(client: TestClient):
     """
     Creates a seashell and then fetches it by its ID.
@@ -172,6 +191,50 @@ def test_update_seashell(client: TestClient):
     assert data["species"] == "Old Species"
 
 
+def test_update_deleted_seashell(client: TestClient, assert_max_queries):
+    """
+    Tries to update a seashell that was already deleted.
+    Should return 404 from the single UPDATE, without changing anything.
+    """
+    create_response = client.post(
+        "/seashells/",
+        json={"name": "Gone", "species": "Gone"}
+    )
+    seashell_id = create_response.json()["id"]
+    client.delete(f"/seashells/{seashell_id}")
+    
+    with assert_max_queries(1):
+        response = client.put(f"/seashells/{seashell_id}", json={"name": "Back"})
+    
+    assert response.status_code == 404
+
+
+def test_update_seashell_without_changes(client: TestClient):
+    """
+    Sends an update with no fields.
+    Should return the seashell unchanged.
+    """
+    create_response = client.post(
+        "/seashells/",
+        json={"name": "Same", "species": "Same"}
+    )
+    seashell_id = create_response.json()["id"]
+    
+    response = client.put(f"/seashells/{seashell_id}", json={})
+    
+    assert response.status_code == 200
+    assert response.json()["name"] == "Same"
+
+
+def test_delete_nonexistent_seashell(client: TestClient):
+    """
+    Tries to delete a seashell that doesn't exist.
+    Should return a 404 error.
+    """
+    response = client.delete("/seashells/99999")
+    assert response.status_code == 404
+
+
 def test_delete_seashell(client: TestClient):
     """
     Creates a seashell and then deletes it.
@@ -188,3 +251,173 @@ def test_delete_seashell(client: TestClient):
     
     get_response = client.get(f"/seashells/{seashell_id}")
     assert get_response.status_code == 404
+
+
+def test_get_seashells_batch(client: TestClient):
+    """
+    Fetches several seashells at once by ID.
+    Items should come back in the requested order, with unknown IDs listed as missing.
+    """
+    ids = [
+        client.post("/seashells/", json={"name": f"Shell {i}", "species": f"Species {i}"}).json()["id"]
+        for i in range(3)
+    ]
+    
+    response = client.get(f"/seashells/batch?ids={ids[2]},99999,{ids[0]}")
+    data = response.json()
+    
+    assert response.status_code == 200
+    assert [item["id"] for item in data["items"]] == [ids[2], ids[0]]
+    assert data["missing"] == [99999]
+
+
+def test_get_seashells_batch_skips_deleted(client: TestClient):
+    """
+    Deletes one seashell and then fetches it in a batch.
+    Deleted shells should be reported as missing, just like a single GET returns 404.
+    """
+    keep_id = client.post("/seashells/", json={"name": "Keep", "species": "Keep"}).json()["id"]
+    delete_id = client.post("/seashells/", json={"name": "Delete", "species": "Delete"}).json()["id"]
+    client.delete(f"/seashells/{delete_id}")
+    
+    response = client.post("/seashells/batch", json={"ids": [delete_id, keep_id]})
+    data = response.json()
+    
+    assert response.status_code == 200
+    assert [item["id"] for item in data["items"]] == [keep_id]
+    assert data["missing"] == [delete_id]
+
+
+def test_get_seashells_batch_keeps_duplicates(client: TestClient, assert_max_queries):
+    """
+    Asks for the same ID more than once in a batch.
+    Every requested ID should appear in the output, still with a single query.
+    """
+    first_id = client.post("/seashells/", json={"name": "First", "species": "First"}).json()["id"]
+    second_id = client.post("/seashells/", json={"name": "Second", "species": "Second"}).json()["id"]
+    
+    with assert_max_queries(1):
+        response = client.get(f"/seashells/batch?ids={first_id},{first_id},{second_id},99999,99999")
+    data = response.json()
+    
+    assert response.status_code == 200
+    assert [item["id"] for item in data["items"]] == [first_id, first_id, second_id]
+    assert data["missing"] == [99999, 99999]
+
+
+def test_get_seashells_batch_invalid_ids(client: TestClient):
+    """
+    Sends a malformed list of IDs.
+    Should fail validation instead of reaching the database.
+    """
+    response = client.get("/seashells/batch?ids=1,abc")
+    assert response.status_code == 422
+
+
+def test_list_seashells_created_range(client: TestClient, session: Session):
+    """
+    Adds seashells on different days and asks for a time window.
+    Only shells created inside the window should come back.
+    """
+    session.add(Seashell(name="Old", species="Old", created_at=datetime(2026, 1, 1)))
+    session.add(Seashell(name="This Week", species="New", created_at=datetime(2026, 3, 10)))
+    session.add(Seashell(name="Next Week", species="New", created_at=datetime(2026, 3, 17)))
+    session.commit()
+    
+    response = client.get(
+        "/seashells/?created_after=2026-03-09T00:00:00Z&created_before=2026-03-16T00:00:00Z"
+    )
+    data = response.json()
+    
+    assert response.status_code == 200
+    assert [item["name"] for item in data] == ["This Week"]
+
+
+def test_list_seashells_sort_by_created_at(client: TestClient, session: Session):
+    """
+    Adds seashells out of creation order and sorts by created_at, newest first.
+    """
+    session.add(Seashell(name="Middle", species="M", created_at=datetime(2026, 2, 1)))
+    session.add(Seashell(name="Newest", species="N", created_at=datetime(2026, 3, 1)))
+    session.add(Seashell(name="Oldest", species="O", created_at=datetime(2026, 1, 1)))
+    session.commit()
+    
+    response = client.get("/seashells/?sort_by=created_at&order=desc")
+    data = response.json()
+    
+    assert response.status_code == 200
+    assert [item["name"] for item in data] == ["Newest", "Middle", "Oldest"]
+    assert data[0]["created_at"].startswith("2026-03-01")
+
+
+def test_query_budget_per_endpoint(client: TestClient, assert_max_queries):
+    """
+    Locks in how many SQL statements each endpoint runs.
+    If a change adds queries to an endpoint, this test should be updated on purpose.
+    """
+    with assert_max_queries(1):
+        seashell_id = client.post(
+            "/seashells/", json={"name": "Budget", "species": "Budget"}
+        ).json()["id"]
+    
+    with assert_max_queries(1):
+        client.get("/seashells/?search=Budget&sort_by=name")
+    
+    with assert_max_queries(1):
+        client.get(f"/seashells/{seashell_id}")
+    
+    with assert_max_queries(1):
+        client.get(f"/seashells/batch?ids={seashell_id},99999")
+    
+    with assert_max_queries(1):
+        client.put(f"/seashells/{seashell_id}", json={"name": "Budget 2"})
+    
+    with assert_max_queries(1):
+        client.delete(f"/seashells/{seashell_id}")
+
+
+def test_server_timing_header(client: TestClient):
+    """
+    Checks that responses report their database cost.
+    The Server-Timing header should show the number of queries the request ran.
+    """
+    response = client.get("/seashells/")
+    
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+
+
+def test_list_seashells_cached_until_write(client: TestClient, assert_max_queries):
+    """
+    Lists the same page twice, then adds a seashell and lists again.
+    The repeat should come from the cache without a query; the write should invalidate it.
+    """
+    client.post("/seashells/", json={"name": "First", "species": "First"})
+    
+    first = client.get("/seashells/")
+    with assert_max_queries(0):
+        second = client.get("/seashells/")
+    
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+    
+    client.post("/seashells/", json={"name": "Second", "species": "Second"})
+    third = client.get("/seashells/")
+    
+    assert third.headers["X-Cache"] == "MISS"
+    assert [item["name"] for item in third.json()] == ["First", "Second"]
+    
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_list_seashells_page_size_limit(client: TestClient):
+    """
+    Asks for more than 100 items per page.
+    Should fail validation.
+    """
+    response = client.get("/seashells/?page_size=101")
+    assert response.status_code == 422
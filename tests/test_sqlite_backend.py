@@ -0,0 +1,128 @@
+from contextlib import ExitStack
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import SQLModel
+
+from app.db.sqlite import (
+    SQLITE_READER_POOL_SIZE,
+    RoutingSession,
+    create_sqlite_engines,
+    setup_search_index,
+)
+from app.schemas.seashell import SeashellCreate, SeashellUpdate
+from app.services.seashell_service import SeashellService
+
+
+@pytest.fixture(name="sqlite_engines")
+def sqlite_engines_fixture(tmp_path):
+    """
+    Sets up a file-backed SQLite database the way the embedded backend runs it.
+    """
+    writer, reader = create_sqlite_engines(f"sqlite:///{tmp_path / 'seashells.db'}")
+    SQLModel.metadata.create_all(writer)
+    setup_search_index(writer)
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+def test_connections_are_tuned(sqlite_engines):
+    """
+    Checks the pragmas applied on connect.
+    Writers should use WAL with NORMAL sync; readers should be read-only.
+    """
+    writer, reader = sqlite_engines
+    
+    with writer.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+    
+    with reader.connect() as connection:
+        assert connection.execute(text("PRAGMA query_only")).scalar() == 1
+
+
+def test_reader_pool_grows_past_pool_size(sqlite_engines):
+    """
+    Checks out more reader connections than the pool keeps open.
+    Extra readers should open right away instead of waiting on the pool.
+    """
+    _, reader = sqlite_engines
+    
+    with ExitStack() as stack:
+        connections = [
+            stack.enter_context(reader.connect())
+            for _ in range(SQLITE_READER_POOL_SIZE + 2)
+        ]
+        assert all(connection.execute(text("SELECT 1")).scalar() == 1 for connection in connections)
+
+
+def test_routing_session_reads_and_writes(sqlite_engines):
+    """
+    Creates, updates and lists seashells through the routing session.
+    Writes should land through the writer and be visible to the readers.
+    """
+    writer, reader = sqlite_engines
+    
+    with RoutingSession(writer=writer, reader=reader) as session:
+        created = SeashellService.create_seashell(
+            SeashellCreate(name="Queen Conch", species="Strombus gigas"), session
+        )
+        SeashellService.update_seashell(created.id, SeashellUpdate(name="King Conch"), session)
+        
+        fetched = SeashellService.get_seashell_by_id(created.id, session)
+    
+    assert fetched.name == "King Conch"
+
+
+def test_search_uses_fts_index(sqlite_engines):
+    """
+    Searches with the FTS5 trigram index.
+    Should match substrings case-insensitively and follow updates, like the ILIKE search.
+    """
+    writer, reader = sqlite_engines
+    
+    with RoutingSession(writer=writer, reader=reader) as session:
+        conch = SeashellService.create_seashell(
+            SeashellCreate(name="Queen Conch", species="Strombus gigas"), session
+        )
+        SeashellService.create_seashell(
+            SeashellCreate(name="Tiger Cowrie", species="Cypraea tigris", description="Spotted"), session
+        )
+        
+        assert [s.name for s in SeashellService.get_seashells(0, 10, session, search="conc")] == ["Queen Conch"]
+        assert [s.name for s in SeashellService.get_seashells(0, 10, session, search="SPOT")] == ["Tiger Cowrie"]
+        
+        SeashellService.update_seashell(conch.id, SeashellUpdate(name="Pink Shell"), session)
+        
+        assert SeashellService.get_seashells(0, 10, session, search="conch") == []
+        assert [s.name for s in SeashellService.get_seashells(0, 10, session, search="pink")] == ["Pink Shell"]
+        # Too short for trigrams, falls back to ILIKE
+        assert [s.name for s in SeashellService.get_seashells(0, 10, session, search="ti")] == ["Tiger Cowrie"]
+
+
+def test_fts_and_ilike_search_agree(sqlite_engines, monkeypatch):
+    """
+    Runs the same searches through the FTS index and through ILIKE.
+    Both should treat % and _ literally and return the same shells.
+    """
+    writer, reader = sqlite_engines
+    searches = ["a_c", "50%", "conch", "CONCH", "shell", "ack\\sl", "zzz"]
+    
+    with RoutingSession(writer=writer, reader=reader) as session:
+        for name in ["abc shell", "a_c shell", "50% off", "5000 off", "Queen Conch", "Back\\slash"]:
+            SeashellService.create_seashell(SeashellCreate(name=name, species="Mixed"), session)
+        
+        def run_searches():
+            return {
+                search: [s.name for s in SeashellService.get_seashells(0, 10, session, search=search)]
+                for search in searches
+            }
+        
+        fts_results = run_searches()
+        monkeypatch.setattr("app.services.seashell_service.uses_search_index", lambda session: False)
+        ilike_results = run_searches()
+    
+    assert fts_results == ilike_results
+    assert fts_results["a_c"] == ["a_c shell"]
+    assert fts_results["50%"] == ["50% off"]
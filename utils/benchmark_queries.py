@@ -0,0 +1,170 @@
+"""
+Benchmark script for the seashell service queries.
+Measures CPU time per query for the hot read and write paths.
+
+Runs against an in-memory SQLite database by default. Pass --database-url
+to run the same numbers against PostgreSQL.
+"""
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description='Benchmark seashell service queries')
+parser.add_argument('--database-url', default='sqlite://', help='Database to benchmark against')
+parser.add_argument('--rows', type=int, default=1000, help='Number of seashells to seed')
+parser.add_argument('--iterations', type=int, default=5000, help='Queries per benchmark')
+args = parser.parse_args()
+
+# app.db.session refuses to import without a DATABASE_URL
+os.environ.setdefault("DATABASE_URL", args.database_url)
+
+
+from sqlmodel import SQLModel, Session, create_engine, select  # noqa: E402
+from sqlmodel.pool import StaticPool  # noqa: E402
+from app.models.seashell import Seashell  # noqa: E402
+from app.schemas.seashell import SeashellCreate, SeashellUpdate  # noqa: E402
+from app.services.seashell_service import SeashellService  # noqa: E402
+
+
+def legacy_get_seashells(skip, limit, session, search=None, sort_by="id", order="asc"):
+    """The pre-cached query builder, kept here as the baseline"""
+    statement = select(Seashell).where(Seashell.deleted.is_(False))
+    if search:
+        search_filter = f"%{search}%"
+        statement = statement.where(
+            (Seashell.name.ilike(search_filter)) |
+            (Seashell.species.ilike(search_filter)) |
+            (Seashell.description.ilike(search_filter))
+        )
+    sort_column = getattr(Seashell, sort_by, Seashell.id)
+    if order == "desc":
+        statement = statement.order_by(sort_column.desc())
+    else:
+        statement = statement.order_by(sort_column.asc())
+    statement = statement.offset(skip).limit(limit)
+    return session.exec(statement).all()
+
+
+def legacy_get_seashell_by_id(seashell_id, session):
+    """The pre-cached id lookup, kept here as the baseline"""
+    seashell = session.get(Seashell, seashell_id)
+    return seashell if seashell and not seashell.deleted else None
+
+
+def legacy_create_seashell(seashell_data, session):
+    """The pre-RETURNING create (INSERT, then refresh SELECT), kept here as the baseline"""
+    db_seashell = Seashell.model_validate(seashell_data)
+    session.add(db_seashell)
+    session.commit()
+    session.refresh(db_seashell)
+    return db_seashell
+
+
+def legacy_update_seashell(seashell_id, seashell_update, session):
+    """The pre-RETURNING update (SELECT, UPDATE, refresh SELECT), kept here as the baseline"""
+    seashell = session.get(Seashell, seashell_id)
+    for key, value in seashell_update.model_dump(exclude_unset=True).items():
+        setattr(seashell, key, value)
+    session.add(seashell)
+    session.commit()
+    session.refresh(seashell)
+    return seashell
+
+
+def make_engine(database_url):
+    """Create the benchmark engine without SQL echo so logging doesn't skew the numbers"""
+    if database_url.startswith("sqlite"):
+        return create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    return create_engine(database_url)
+
+
+def seed(engine, rows):
+    """Create the table and fill it with benchmark rows"""
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(rows):
+            session.add(Seashell(
+                name=f"Shell {i}",
+                species=f"Species {i % 50}",
+                description=f"Benchmark shell number {i}",
+            ))
+        session.commit()
+
+
+def measure(label, func, iterations):
+    """Run func repeatedly and print wall and CPU time per call"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for i in range(iterations):
+        func(i)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    print(
+        f"  {label:<40} {cpu / iterations * 1e6:8.1f} us CPU/query   "
+        f"{iterations / wall:10.0f} queries/s"
+    )
+
+
+def run_benchmarks(engine, rows, iterations):
+    """Compare the legacy and current paths for each hot query shape"""
+    with Session(engine) as session:
+        print("Id lookup:")
+        measure("legacy session.get", lambda i: (
+            legacy_get_seashell_by_id(i % rows + 1, session), session.expunge_all()
+        ), iterations)
+        measure("cached statement", lambda i: (
+            SeashellService.get_seashell_by_id(i % rows + 1, session), session.expunge_all()
+        ), iterations)
+
+        print("List by sort/order:")
+        measure("legacy builder", lambda i: legacy_get_seashells(
+            (i % 10) * 10, 10, session, sort_by="name", order="desc"
+        ), iterations)
+        measure("cached statement", lambda i: SeashellService.get_seashells(
+            (i % 10) * 10, 10, session, sort_by="name", order="desc"
+        ), iterations)
+
+        print("List with search:")
+        measure("legacy builder", lambda i: legacy_get_seashells(
+            0, 10, session, search=f"Species {i % 50}"
+        ), iterations)
+        measure("cached statement", lambda i: SeashellService.get_seashells(
+            0, 10, session, search=f"Species {i % 50}"
+        ), iterations)
+
+        new_shell = SeashellCreate(name="Benchmark", species="Benchmark")
+        print("Create:")
+        measure("legacy insert + refresh", lambda i: (
+            legacy_create_seashell(new_shell, session), session.expunge_all()
+        ), iterations)
+        measure("INSERT ... RETURNING", lambda i: (
+            SeashellService.create_seashell(new_shell, session), session.expunge_all()
+        ), iterations)
+
+        print("Update:")
+        measure("legacy get + update + refresh", lambda i: (
+            legacy_update_seashell(i % rows + 1, SeashellUpdate(name=f"Legacy {i}"), session),
+            session.expunge_all(),
+        ), iterations)
+        measure("UPDATE ... RETURNING", lambda i: (
+            SeashellService.update_seashell(i % rows + 1, SeashellUpdate(name=f"Returning {i}"), session),
+            session.expunge_all(),
+        ), iterations)
+
+
+if __name__ == "__main__":
+    engine = make_engine(args.database_url)
+    print(f"Seeding {args.rows} seashells...")
+    seed(engine, args.rows)
+    print(f"Running {args.iterations} iterations per benchmark\n")
+    run_benchmarks(engine, args.rows, args.iterations)
@@ -0,0 +1,45 @@
+"""
+Script to switch the seashell table to monthly partitions (PostgreSQL only).
+Time-range queries on created_at then only scan the months they ask for.
+
+Run it after `alembic upgrade head`. Pass --undo to go back to a plain table.
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description='Partition the seashell table by month')
+parser.add_argument('--database-url', default=os.getenv("DATABASE_URL"), help='PostgreSQL database (default: DATABASE_URL)')
+parser.add_argument('--undo', action='store_true', help='Convert back to a plain table')
+args = parser.parse_args()
+
+
+from sqlalchemy import create_engine  # noqa: E402
+from app.db.partitioning import is_partitioned, partition_seashell_by_month, unpartition_seashell  # noqa: E402
+
+
+def main():
+    if not args.database_url or not args.database_url.startswith("postgresql"):
+        print("Partitioning needs a PostgreSQL --database-url (or DATABASE_URL)")
+        sys.exit(1)
+
+    engine = create_engine(args.database_url)
+    with engine.begin() as connection:
+        if args.undo:
+            unpartition_seashell(connection)
+        else:
+            partition_seashell_by_month(connection)
+        print(f"seashell is {'now' if is_partitioned(connection) else 'not'} partitioned by month")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error partitioning seashell: {e}")
+        sys.exit(1)